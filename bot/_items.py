@@ -3,6 +3,8 @@
 import pydantic
 import datetime
 
+from typing import Iterator
+
 import aconio.db as db
 import aconio.dao as dao
 
@@ -13,42 +15,24 @@ class Item(pydantic.BaseModel):
     client: dao.Client
 
 
-def create_work_items_from_db(bmd_db: db.MSSQLConnection) -> list[Item]:
-    """Create a work item for each client whose birthday is today."""
-
-    rows = bmd_db.execute_query_from_file("queries/birthdays.sql")
-
-    items = []
-    for row in rows:
-        if _dob_is_today(row):
-            items.append(_create_item_from_row(bmd_db, row))
-
-    return items
-
+def create_work_items_from_db(bmd_db: db.MSSQLConnection) -> Iterator[Item]:
+    """Yield a work item for each client whose birthday is today."""
 
-def _dob_is_today(row: dict) -> bool:
-    """Check if the client's birthday is today."""
+    # The birthday filter is applied by the database, so that only today's
+    # birthdays have to be transferred and processed. The date is passed as
+    # query parameters, which are quoted by the database driver.
     today = datetime.date.today()
-    return row["dob"].day == today.day and row["dob"].month == today.month
-
-
-def _create_item_from_row(bmd_db: db.MSSQLConnection, row: dict) -> dao.Client:
-    """Create a work item from a `queries/birthdays.sql` query row."""
-
-    client_dao = dao.ClientDAO(conn=bmd_db)
-
-    client = client_dao.with_ids(
-        client_bmd_company_id=row["bmd_company_id"],
-        client_bmd_id=row["bmd_id"],
+    rows = bmd_db.iter_query_from_file(
+        "queries/birthdays.sql", params=(today.month, today.day)
     )
 
-    client_dao.set_emails_to_display(client)
-
-    client_dao.set_employees(
-        client=client,
-        bmd_frist_id=None,
-        bmd_sachbearbeiter=dao.BMDSachbearbeiter.HAUPT,
-        append_mode=dao.EmployeeSelectionMode.SB_ONLY,
+    # All clients are loaded with a single query instead of fetching the
+    # client data, e-mails and employees separately for each client. The ids
+    # are collected first, since the connection is busy until all birthday
+    # rows have been fetched.
+    clients = dao.ClientDAO(conn=bmd_db).load_many(
+        [(row["bmd_id"], row["bmd_company_id"]) for row in rows]
     )
 
-    return Item(client=client)
+    for client in clients:
+        yield Item(client=client)
@@ -1,30 +1,53 @@
 """Functions utilized by the consumer process."""
 
+from __future__ import annotations
+
+import typing
 import functools
-import jinja2 as j2
 
-import aconio.outlook as outlook
 import aconio.core.decorators as decorators
 
 import bot._items as _items
 import bot._config as _config
 
+if typing.TYPE_CHECKING:
+    import jinja2 as j2
+
 
-@functools.lru_cache
+@functools.cache
 def config() -> _config.ConsumerConfig:
     return _config.ConsumerConfig()
 
 
-@functools.lru_cache
+@functools.cache
 def jinja() -> j2.Environment:
-    return j2.Environment()
+    # Jinja is imported lazily, since it is only required by the consumer
+    # process and not by the producer, which imports this module as well.
+    # pylint: disable-next=import-outside-toplevel,redefined-outer-name
+    import jinja2 as j2
+
+    return j2.Environment(
+        loader=j2.FileSystemLoader("templates"),
+        undefined=j2.StrictUndefined,
+    )
+
+
+@functools.cache
+def mail_body() -> str:
+    """Return the rendered e-mail body.
+
+    The template does not depend on the work item, thus it is only rendered
+    once per process.
+    """
+    return jinja().get_template("mail.j2").render()
 
 
 def setup() -> None:
     """Setup consumer process."""
-
-    jinja().loader = j2.FileSystemLoader("templates")
-    jinja().undefined = j2.StrictUndefined
+    # Outlook is imported lazily for the same reason as Jinja, additionally
+    # its dependencies are expensive to import.
+    # pylint: disable-next=import-outside-toplevel
+    import aconio.outlook as outlook
 
     outlook.start()
 
@@ -39,12 +62,15 @@ def teardown() -> None:
 def run(item: _items.Item):
     """Processes a single work item."""
 
+    # pylint: disable-next=import-outside-toplevel
+    import aconio.outlook as outlook
+
     outlook.send_email(
         to=item.client.emails,
         cc=item.client.employee_emails,
         send_as="office@swstb.at",
         subject=config().subject,
-        body=jinja().get_template("mail.j2").render(),
+        body=mail_body(),
         html_body=True,
         draft=config().test_mode,
     )
@@ -2,6 +2,8 @@
 
 import functools
 
+from typing import Iterator
+
 import aconio.db as db
 import aconio.core.errors as errors
 
@@ -9,12 +11,12 @@ import bot._items as _items
 import bot._config as _config
 
 
-@functools.lru_cache
+@functools.cache
 def config() -> _config.ProducerConfig:
     return _config.ProducerConfig()
 
 
-@functools.lru_cache
+@functools.cache
 def bmd_db() -> db.MSSQLConnection:
     conn = db.MSSQLConnection().configure_from_vault("bmd_db_credentials")
     return conn
@@ -33,7 +35,7 @@ def teardown() -> None:
     pass
 
 
-def run() -> list[_items.Item]:
-    """Generate a list of work items."""
+def run() -> Iterator[_items.Item]:
+    """Generate the work items."""
 
     return _items.create_work_items_from_db(bmd_db())
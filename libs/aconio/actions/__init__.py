@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import enum
 import functools
+import dataclasses
 
 import robocorp.workitems
 
@@ -19,6 +20,34 @@ class ActionState(enum.StrEnum):
     FAILED = "FAILED"
 
 
+_ACTION_STATES: dict[str, ActionState] = {s.value: s for s in ActionState}
+"""Lookup table for converting serialized action states."""
+
+_ERROR_TYPES: dict[str, type[errors.AutomationError]] = {
+    name: obj
+    for name, obj in vars(errors).items()
+    if isinstance(obj, type) and issubclass(obj, errors.AutomationError)
+}
+"""Lookup table for converting serialized action error types."""
+
+
+@dataclasses.dataclass
+class _SerializedError:
+    """Serializable representation of an action error."""
+
+    type: str
+    message: str
+    code: str | None = None
+
+    @classmethod
+    def from_error(cls, error: Exception) -> _SerializedError:
+        return cls(
+            type=type(error).__name__,
+            message=getattr(error, "message", str(error)),
+            code=getattr(error, "code", None),
+        )
+
+
 class Action:
     """Information about an action performed by the Consumer."""
 
@@ -30,51 +59,85 @@ class Action:
     Makes it easier to use the action for process reports later.
     """
 
-    state: ActionState = ActionState.NOT_STARTED
+    _state: ActionState = ActionState.NOT_STARTED
+
+    _error: errors.AutomationError | None = None
 
-    error: errors.AutomationError | None = None
-    """Set if an error occured while processing the action."""
+    _serialized_error: _SerializedError | None = None
+    """Error normalized once upon `update`, used by `to_dict`."""
+
+    _cached_dict: dict | None = None
+    """Result of `to_dict`, cleared whenever the action is updated."""
 
     def __init__(self, name: str, description: str):
         self.name = name
         self.description = description
 
+    @property
+    def state(self) -> ActionState:
+        """State of the action. Use `update` to change it."""
+        return self._state
+
+    @property
+    def error(self) -> errors.AutomationError | None:
+        """Set if an error occured while processing the action."""
+        return self._error
+
+    def update(
+        self,
+        state: ActionState,
+        error: errors.AutomationError | None = None,
+    ) -> None:
+        """Set the state (and error, if given) of the action."""
+        self._state = state
+        if error is not None:
+            self._error = error
+            self._serialized_error = _SerializedError.from_error(error)
+
+        self._cached_dict = None
+
     def to_dict(self):
-        """Return the action as a dictionary."""
+        """Return the action as a dictionary.
 
-        error = None
-        if self.error:
-            error = {
-                "type": type(self.error).__name__,
-                "message": (
-                    self.error.message
-                    if hasattr(self.error, "message")
-                    else str(self.error)
-                ),
-                "code": (
-                    self.error.code if hasattr(self.error, "code") else None
-                ),
+        The dictionary is cached until the action is updated again. A copy of
+        it is returned, so that changes to the result do not affect the cache.
+        """
+        if self._cached_dict is None:
+            error = None
+            if self._serialized_error:
+                error = dataclasses.asdict(self._serialized_error)
+
+            self._cached_dict = {
+                "name": self.name,
+                "description": self.description,
+                "state": self.state,
+                "error": error,
             }
 
-        return {
-            "name": self.name,
-            "description": self.description,
-            "state": self.state,
-            "error": error,
-        }
+        d = dict(self._cached_dict)
+        if d["error"]:
+            d["error"] = dict(d["error"])
+
+        return d
 
     @classmethod
     def from_dict(cls, d: dict) -> Action:
         """Create an action from a dictionary."""
         action = Action(name=d["name"], description=d["description"])
-        action.state = ActionState(d["state"])
 
+        error = None
         if d["error"]:
-            error = getattr(errors, d["error"]["type"])(
+            error = _ERROR_TYPES[d["error"]["type"]](
                 message=d["error"]["message"],
                 code=d["error"]["code"],
             )
-            action.error = error
+
+        try:
+            state = _ACTION_STATES[d["state"]]
+        except KeyError:
+            state = ActionState(d["state"])
+
+        action.update(state=state, error=error)
 
         return action
 
@@ -82,8 +145,14 @@ class Action:
 class _ActionManager:
     """Manage all actions of the consumer."""
 
-    _actions: list[Action]
-    """List of all actions of the consumer."""
+    _actions: dict[str, Action]
+    """All actions of the consumer, mapped by their action name."""
+
+    changed: bool = False
+    """Set if any action changed since the last work item save."""
+
+    saved_item_id: str | None = None
+    """ID of the work item the actions were last saved to."""
 
     def initialize(self, actions: dict[str, str] | type[enum.Enum]) -> None:
         """Initialize the action list with the given action names.
@@ -100,60 +169,74 @@ class _ActionManager:
                 }`
         """
         if isinstance(actions, type) and issubclass(actions, enum.StrEnum):
-            self._actions = [
-                Action(name=action.name, description=action.value)
+            self._actions = {
+                action.name: Action(name=action.name, description=action.value)
                 for action in actions
-            ]
+            }
         else:
-            self._actions = [
-                Action(name=name, description=description)
+            self._actions = {
+                name: Action(name=name, description=description)
                 for name, description in actions.items()
-            ]
+            }
+
+        self.changed = True
 
     def reset(self) -> None:
         """Reset the action states to begin tracking a new work item."""
 
         # We re-initialize the actions list with the same action names,
         # thereby dropping the previous state of the actions.
-        actions = {a.name: a.description for a in self._actions}
+        actions = {a.name: a.description for a in self._actions.values()}
         self.initialize(actions)
 
     def complete(self, action_name: str) -> None:
         """Mark an action as completed."""
-        self._get_action(name=action_name).state = ActionState.SUCCESS
+        self._get_action(name=action_name).update(ActionState.SUCCESS)
+        self.changed = True
 
     def skip(self, action_name: str) -> None:
         """Mark an action as skipped."""
-        self._get_action(name=action_name).state = ActionState.SKIPPED
+        self._get_action(name=action_name).update(ActionState.SKIPPED)
+        self.changed = True
 
     def fail(self, action_name: str, error: errors.AutomationError) -> None:
         """Mark an action as failed."""
-        action = self._get_action(name=action_name)
-        action.state = ActionState.FAILED
-        action.error = error
+        self._get_action(name=action_name).update(ActionState.FAILED, error)
+        self.changed = True
 
     def _get_action(self, name: str) -> Action:
         """Return the action with the given identifier."""
 
-        for action in self._actions:
-            if action.name == name:
-                return action
-
-        raise ValueError(
-            f"Action '{name}' not found. Did you call initialize()?"
-        )
+        try:
+            return self._actions[name]
+        except KeyError as exc:
+            raise ValueError(
+                f"Action '{name}' not found. Did you call initialize()?"
+            ) from exc
 
     def to_dict(self) -> dict:
         """Return the action list holding the actions as dictionaries."""
-        return [a.to_dict() for a in self._actions]
+        return [a.to_dict() for a in self._actions.values()]
 
 
-@functools.lru_cache
+@functools.cache
 def action_manager() -> _ActionManager:
     return _ActionManager()
 
 
 def append_to_work_item(item: robocorp.workitems.Input) -> None:
-    """Append the current actions list to the payload of the given item."""
-    item.payload["actions"] = action_manager().to_dict()
+    """Append the current actions list to the payload of the given item.
+
+    The item is only saved if any action changed since the last call, or if
+    the actions were last saved to a different item. This avoids redundant
+    Control Room round trips.
+    """
+    manager = action_manager()
+    if not manager.changed and manager.saved_item_id == item.id:
+        return
+
+    item.payload["actions"] = manager.to_dict()
     item.save()
+
+    manager.changed = False
+    manager.saved_item_id = item.id
@@ -11,6 +11,9 @@ import aconio.core.errors as errors
 # Typedefs
 action_manager = aconio.actions.action_manager
 
+_active_actions = 0
+"""Number of currently entered (possibly nested) action contexts."""
+
 
 # pylint: disable=invalid-name
 class action(contextlib.ContextDecorator):
@@ -22,6 +25,10 @@ class action(contextlib.ContextDecorator):
 
     Note that the given action name must match one of the action names defined
     in the action manager.
+
+    The action states are appended to the current work item once the
+    outer-most action exits. Thus, nested actions only cause a single
+    work item save.
     """
 
     def __init__(self, action_name: str | enum.Enum):
@@ -46,18 +53,24 @@ class action(contextlib.ContextDecorator):
         return wrapper
 
     def __enter__(self):
-        pass
+        global _active_actions  # pylint: disable=global-statement
+        _active_actions += 1
 
     def __exit__(self, exc_type, exc_value, traceback):
+        global _active_actions  # pylint: disable=global-statement
+        _active_actions -= 1
+
         if exc_type is not None:
             exc = self._convert_to_automation_error(exc_value)
             action_manager().fail(self.action_name, exc)
         else:
             action_manager().complete(self.action_name)
 
-        # Append the action payload to the current work item
-        active_work_item = robocorp.workitems.inputs.current
-        aconio.actions.append_to_work_item(active_work_item)
+        # Append the action payload to the current work item, once the
+        # outer-most action is finished
+        if _active_actions == 0:
+            active_work_item = robocorp.workitems.inputs.current
+            aconio.actions.append_to_work_item(active_work_item)
 
         # Return "False" to propagate the exception if any
         return False
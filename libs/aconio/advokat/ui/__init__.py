@@ -8,6 +8,7 @@ from robocorp import windows, log
 from aconio.core import utils
 
 from aconio.advokat.ui import erv
+from aconio.advokat.ui import _locators
 from aconio.advokat.ui import act_mgmt
 from aconio.advokat.ui import ds_assistant
 
@@ -30,15 +31,14 @@ def open_application(exe_path: str) -> None:
     """Open the Advokat application."""
     subprocess.run([exe_path], check=True)
 
-    _wait_for_advokat_window(retries=5)
+    _wait_for_advokat_window(timeout=50)
 
 
-def _wait_for_advokat_window(retries: int, timeout: int = 10) -> None:
-    for _ in range(retries):
-        if is_open(timeout):
-            return
-
-    raise RuntimeError("Failed to open Advokat application.")
+def _wait_for_advokat_window(timeout: int) -> None:
+    # `find_window` already polls until the window appears or the timeout is
+    # reached, so a single call is sufficient.
+    if not is_open(timeout):
+        raise RuntimeError("Failed to open Advokat application.")
 
 
 def close_application() -> None:
@@ -55,7 +55,7 @@ def close_application() -> None:
 
 def _close_advokat_window() -> None:
     """Close the Advokat window."""
-    menu = window().find('name:"Anwendungsmenü"').find('name:"Programme"')
+    menu = window().find(_locators.APP_MENU).find(_locators.PROGRAMS_MENU)
     menu.click()
 
     menu.find('control:MenuItemControl and subname:"Beenden"').click()
@@ -70,7 +70,7 @@ def start_program(name: str) -> None:
             an item from the Advokat "Programme" menu bar.
     """
 
-    menu = window().find('name:"Anwendungsmenü"').find('name:"Programme"')
+    menu = window().find(_locators.APP_MENU).find(_locators.PROGRAMS_MENU)
     menu.click()
 
     menu.find(f'control:MenuItemControl and name:"{name}"').click()
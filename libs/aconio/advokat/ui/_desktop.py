@@ -5,6 +5,6 @@ import functools
 from RPA.Desktop import Desktop
 
 
-@functools.lru_cache
+@functools.cache
 def desktop() -> Desktop:
     return Desktop()
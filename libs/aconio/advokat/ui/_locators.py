@@ -4,21 +4,35 @@ from __future__ import annotations
 
 import os
 import functools
-import dataclasses
+
+APP_MENU = 'name:"Anwendungsmenü"'
+"""The `robocorp.windows` locator of the application menu bar."""
+
+PROGRAMS_MENU = 'name:"Programme"'
+"""The `robocorp.windows` locator of the "Programme" menu."""
+
+EDIT_MENU = 'name:"Bearbeiten"'
+"""The `robocorp.windows` locator of the "Bearbeiten" menu."""
 
 
-@dataclasses.dataclass
 class _AdvokatLocators:
-    """Collection of Advokat-related locators usable by `RPA.Desktop`."""
+    """Collection of Advokat-related locators usable by `RPA.Desktop`.
+
+    All image locators are constructed once upon class initialization.
+    """
 
     _images_folder: str = os.path.join(
         os.path.dirname(os.path.abspath(__file__)), "_images"
     )
 
+    cancel_button: str
+
     def __init__(self, images_folder: str | None = None) -> None:
         if images_folder:
             self._images_folder = images_folder
 
+        self.cancel_button = self._image("cancel_button.png")
+
     def _image(self, filename: str) -> str:
         """Return a proper image locator specifier for the given filename.
 
@@ -27,11 +41,7 @@ class _AdvokatLocators:
         """
         return "image:" + os.path.join(self._images_folder, filename)
 
-    @property
-    def cancel_button(self) -> str:
-        return self._image("cancel_button.png")
-
 
-@functools.lru_cache
+@functools.cache
 def locators() -> _AdvokatLocators:
     return _AdvokatLocators()
@@ -2,7 +2,7 @@
 
 from robocorp import windows
 
-from aconio.advokat.ui import _errors
+from aconio.advokat.ui import _errors, _locators
 
 
 def window(**kwargs) -> windows.WindowElement:
@@ -13,7 +13,7 @@ def window(**kwargs) -> windows.WindowElement:
 
 
 def close() -> None:
-    menu = window().find('name:"Anwendungsmenü"').find('name:"Programme"')
+    menu = window().find(_locators.APP_MENU).find(_locators.PROGRAMS_MENU)
     menu.click()
 
     menu.find('control:MenuItemControl and subname:"Schließen"').click()
@@ -110,7 +110,7 @@ def open_act_master_data() -> windows.WindowElement:
 
 def open_for_editing() -> windows.WindowElement:
     """Open the currently selected record for editing."""
-    menu = window().find('name:"Anwendungsmenü"').find('name:"Bearbeiten"')
+    menu = window().find(_locators.APP_MENU).find(_locators.EDIT_MENU)
     menu.click()
 
     menu.find('control:MenuItemControl and name:"Ändern"').click()
@@ -126,7 +126,7 @@ def new_entry(entry_type: str) -> None:
             Type of the entry to create. Must be a selectable type from the
             Advokat menu "Bearbeiten" > "Neu".
     """
-    menu = window().find('name:"Anwendungsmenü"').find('name:"Bearbeiten"')
+    menu = window().find(_locators.APP_MENU).find(_locators.EDIT_MENU)
     menu.click()
 
     menu.find('control:MenuItemControl and name:"Neu"').click()
@@ -4,6 +4,8 @@ import enum
 
 from robocorp import windows
 
+from aconio.advokat.ui import _locators
+
 
 class ViewType(enum.StrEnum):
     OUTBOUND = enum.auto()
@@ -19,7 +21,7 @@ def window(**kwargs) -> windows.WindowElement:
 
 
 def close() -> None:
-    menu = window().find('name:"Anwendungsmenü"').find('name:"Programme"')
+    menu = window().find(_locators.APP_MENU).find(_locators.PROGRAMS_MENU)
     menu.click()
 
     menu.find('control:MenuItemControl and subname:"Schließen"').click()
@@ -10,7 +10,7 @@ from aconio.bmd._exec_types import ExecutableType
 from aconio.bmd._params import BMDParam
 
 
-@functools.lru_cache
+@functools.cache
 def config() -> Config:
     return Config()
 
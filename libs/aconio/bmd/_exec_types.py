@@ -30,13 +30,10 @@ class ExecutableType(enum.StrEnum):
             value:
                 Must either be 'NTCS' or 'EXEC'.
         """
-        match value:
-            case "NTCS":
-                return ExecutableType.NTCS
-            case "EXEC":
-                return ExecutableType.EXEC
-            case _:
-                raise ValueError(
-                    f"Invalid BMD executable type '{value}'! "
-                    "Please use 'NTCS' or 'EXEC'."
-                )
+        try:
+            return cls[value]
+        except KeyError as exc:
+            raise ValueError(
+                f"Invalid BMD executable type '{value}'! "
+                "Please use 'NTCS' or 'EXEC'."
+            ) from exc
@@ -1,9 +1,10 @@
 """Representation of BMD CLI parameters."""
 
+import functools
 import dataclasses
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(frozen=True)
 class BMDParam:
     """BMD CLI parameter.
 
@@ -15,6 +16,10 @@ class BMDParam:
     value: str | None = None
 
     def __str__(self) -> str:
+        return self._formatted
+
+    @functools.cached_property
+    def _formatted(self) -> str:
         if self.value:
             return f"/{self.key}={self.value}"
         else:
@@ -12,8 +12,14 @@ from aconio.bmd import _params
 from aconio.bmd._params import BMDParam
 from aconio.bmd._config import config, ExecutableType, BMDLoginDetails
 
+# Parameters which are the same for every CLI call, constructed only once
+_PRODUCT_PARAM = BMDParam("PRODUCT", "BMDNTCS")
+_SHOW_MESSAGES_PARAM = BMDParam("NOMESSAGES", "0")
+_HIDE_MESSAGES_PARAM = BMDParam("NOMESSAGES", "1")
+_FINISH_PARAM = BMDParam("FINISH")
 
-@functools.lru_cache
+
+@functools.cache
 def ntcs_cli() -> BMDExecutable:
     return BMDExecutable(
         ntcs_dir=config().ntcs_dir,
@@ -34,6 +40,12 @@ class BMDExecutable:
     _login_details: BMDLoginDetails | None
     """BMD login information."""
 
+    _executable_path: str
+    """Full path to the BMD executable."""
+
+    _login_args: list[str]
+    """BMD login information as CLI arguments."""
+
     def __init__(
         self,
         ntcs_dir: str,
@@ -58,10 +70,18 @@ class BMDExecutable:
 
         self._login_details = login_details
 
+        self._executable_path = os.path.join(
+            self._ntcs_dir, self._exec_type.value
+        )
+
+        self._login_args = []
+        if login_details:
+            self._login_args = [str(p) for p in login_details.get_params()]
+
     @property
     def executable_path(self) -> str:
         """Full path to the BMD executable."""
-        return os.path.join(self._ntcs_dir, self._exec_type.value)
+        return self._executable_path
 
     def start(
         self,
@@ -124,24 +144,21 @@ class BMDExecutable:
                 to `True`.
         """
 
-        bmd_parameters = [
-            BMDParam("PRODUCT", "BMDNTCS"),
-            BMDParam("FUNC", function_name),
-        ]
+        bmd_parameters = [_PRODUCT_PARAM, BMDParam("FUNC", function_name)]
 
         if params:
             bmd_parameters.extend(_params.bmd_params_from_dict(params))
 
         if messages:
-            bmd_parameters.append(BMDParam("NOMESSAGES", "0"))
+            bmd_parameters.append(_SHOW_MESSAGES_PARAM)
         else:
-            bmd_parameters.append(BMDParam("NOMESSAGES", "1"))
+            bmd_parameters.append(_HIDE_MESSAGES_PARAM)
 
         # If exec type `NTCS` is used, a new BMDNTCS instance is created
         # for every command. Thus, pass the '/FINISH' parameter to
         # immediately close the instance after the command has finished.
         if self._exec_type == ExecutableType.NTCS:
-            bmd_parameters.append(BMDParam("FINISH"))
+            bmd_parameters.append(_FINISH_PARAM)
 
         self._run(bmd_parameters)
 
@@ -155,11 +172,14 @@ class BMDExecutable:
             params = []
 
         # Add custom BMD login parameters
-        if self._login_details:
-            params.extend(self._login_details.get_params())
+        cmd = [self._executable_path, *map(str, params), *self._login_args]
+
+        # Never log the password of custom BMD logins
+        log_cmd = ["/PWD=***" if c.startswith("/PWD=") else c for c in cmd]
+        log.info("Running BMD CLI command:", log_cmd)
 
-        cmd = [self.executable_path]
-        cmd.extend([str(p) for p in params])
+        # BMD executables are GUI applications, so there is no need to attach
+        # a console window to the started process
+        creationflags = subprocess.CREATE_NO_WINDOW if os.name == "nt" else 0
 
-        log.info(f"Running BMD CLI command: {cmd}")
-        subprocess.run(cmd, check=True)
+        subprocess.run(cmd, check=True, creationflags=creationflags)
@@ -6,6 +6,16 @@ from aconio.core import utils
 from aconio.bmd import cli, _errors
 from aconio.bmd._config import config
 
+# `robocorp.windows` locators of BMD windows & controls
+_LOGIN_WIN = 'name:"Datenbanklogin" and class:TBMDFRMLogin'
+_LOGIN_BTN = 'name:"Anmelden" and class:TBMDButton'
+_UPDATE_DLG = "class:TBMDNCMultiProgressFRM"
+_VERSION_DLG = 'subname:"Neue Version gefunden"'
+_VERSION_DLG_CANCEL_BTN = 'subname:"Abbrechen"'
+_CLOSE_BTN = 'name:"Schließen" and control:ButtonControl'
+_CLOSE_POPUP = 'name:"Achtung"'
+_CLOSE_POPUP_EXIT_BTN = 'name:"Beenden" and class:TButton'
+
 
 def window(**kwargs) -> windows.WindowElement:
     """Return the main BMD window."""
@@ -66,9 +76,7 @@ def _perform_ui_login() -> None:
             "Please use `set_login_details()` in the module configuration."
         )
 
-    login_window = windows.desktop().find(
-        'name:"Datenbanklogin" and class:TBMDFRMLogin', timeout=50
-    )
+    login_window = windows.desktop().find(_LOGIN_WIN, timeout=50)
 
     login_window.send_keys("{LALT}D")
     login_window.send_keys(config().login_params.db)
@@ -79,7 +87,7 @@ def _perform_ui_login() -> None:
     login_window.send_keys("{LALT}P")
     login_window.send_keys(config().login_params.password)
 
-    login_window.find('name:"Anmelden" and class:TBMDButton').click()
+    login_window.find(_LOGIN_BTN).click()
 
 
 def _wait_for_bmd_window() -> None:
@@ -115,9 +123,7 @@ def _find_update_notification() -> windows.WindowElement | None:
     """Find the BMD update notification window."""
     # Here we keep the default timeout of 10 seconds to ensure enough
     # time passes for the update notification to appear.
-    return windows.desktop().find(
-        "class:TBMDNCMultiProgressFRM", raise_error=False
-    )
+    return windows.desktop().find(_UPDATE_DLG, raise_error=False)
 
 
 def _find_bmd_window() -> None:
@@ -131,25 +137,25 @@ def _find_bmd_window() -> None:
 def _catch_version_dialog(timeout: int = 10) -> None:
     """Catch the BMD version dialog and close it if it appears."""
     version_dialog = windows.desktop().find(
-        'subname:"Neue Version gefunden"', raise_error=False, timeout=timeout
+        _VERSION_DLG, raise_error=False, timeout=timeout
     )
 
     if version_dialog:
-        version_dialog.click('subname:"Abbrechen"')
+        version_dialog.click(_VERSION_DLG_CANCEL_BTN)
 
 
 def close_application() -> None:
     """Close the BMD application."""
 
     try:
-        window().find('name:"Schließen" and control:ButtonControl').click()
+        window().find(_CLOSE_BTN).click()
 
         close_app_popup = windows.desktop().find(
-            'name:"Achtung"', raise_error=False, timeout=4
+            _CLOSE_POPUP, raise_error=False, timeout=4
         )
 
         if close_app_popup is not None:
-            close_app_popup.find('name:"Beenden" and class:TButton').click()
+            close_app_popup.find(_CLOSE_POPUP_EXIT_BTN).click()
 
     except windows.ElementNotFound:
         log.warn("Failed to close BMD app, trying to force kill it")
@@ -1,12 +1,10 @@
 """Wrapper for the Robocorp Control Room API."""
 
-import json
-import time
 import requests
 import functools
-from urllib.parse import urljoin
+from urllib3.util import Retry
 
-from typing import Any
+from typing import Any, Iterator
 
 from ._config import config
 
@@ -14,10 +12,44 @@ from ._config import config
 class _ControlRoomAPI:
     """Wrapper for the Robocorp Control Room API."""
 
+    _session: requests.Session
+    """
+    HTTP session shared by all requests, which allows connections to the
+    Control Room API to be kept alive and reused.
+    """
+
+    _retry: Retry = Retry(
+        total=2,
+        backoff_factor=1,
+        status_forcelist=(429, 500, 502, 503, 504),
+        allowed_methods=("GET", "POST"),
+        respect_retry_after_header=True,
+        raise_on_status=False,
+    )
+    """
+    Retry strategy for unsuccessful requests. Retries are performed with
+    exponential backoff, while honoring the `Retry-After` header sent by the
+    Control Room API when requests are throttled.
+    """
+
+    def __init__(self) -> None:
+        self._session = requests.Session()
+        self._session.mount(
+            "https://",
+            requests.adapters.HTTPAdapter(
+                pool_connections=4, pool_maxsize=16, max_retries=self._retry
+            ),
+        )
+
+    def close(self) -> None:
+        """Close all connections held by the underlying HTTP session."""
+        self._session.close()
+
     def get(
         self,
         route: str,
         params: dict[str, str] | None = None,
+        lazy: bool = False,
         **kwargs,
     ) -> Any | bytes:
         """Perform a GET request against the Robocorp Control Room API.
@@ -27,6 +59,10 @@ class _ControlRoomAPI:
                 `/workspaces/{workspace_id}/work-items`.
             params:
                 Query parameters.
+            lazy:
+                If the response is paginated, return an iterator over the
+                results instead of a list. Following pages are only fetched
+                while the iterator is consumed.
             kwargs:
                 Extra keyword arguments passed to `requests.get`.
         Returns:
@@ -45,9 +81,11 @@ class _ControlRoomAPI:
             **kwargs,
         )
 
-        body = json.loads(res.text)
+        body = res.json()
         if self._is_paginated_response(body):
-            body = self._collect_paginated_results(body)
+            body = self._iter_paginated(body)
+            if not lazy:
+                body = list(body)
 
         return body
 
@@ -56,6 +94,7 @@ class _ControlRoomAPI:
         route: str,
         params: dict[str, str] | None = None,
         body: dict | None = None,
+        lazy: bool = False,
         **kwargs,
     ) -> Any | bytes:
         """Perform a POST request against the Robocorp Control Room API.
@@ -65,10 +104,14 @@ class _ControlRoomAPI:
                 `/workspaces/{workspace_id}/work-items`.
             params:
                 Query parameters.
+            lazy:
+                If the response is paginated, return an iterator over the
+                results instead of a list. Following pages are only fetched
+                while the iterator is consumed.
             kwargs:
-                Extra keyword arguments passed to `requests.get`.
+                Extra keyword arguments passed to `requests.post`.
         Returns:
-            The result of the GET request, either in JSON or binary form,
+            The result of the POST request, either in JSON or binary form,
             depending on the `binary` parameter.
         Raises:
             RuntimeError:
@@ -84,9 +127,11 @@ class _ControlRoomAPI:
             body=body,
         )
 
-        body = json.loads(res.text)
+        body = res.json()
         if self._is_paginated_response(body):
-            body = self._collect_paginated_results(body)
+            body = self._iter_paginated(body)
+            if not lazy:
+                body = list(body)
 
         return body
 
@@ -95,90 +140,77 @@ class _ControlRoomAPI:
         method: str,
         url: str,
         body: dict | None = None,
-        retries: int = 3,
-        retry_wait_time: int = 2,
         **kwargs,
     ) -> Any:
         """Perform a request against the Robocorp Control Room API.
-        Wraps `requests.request` and automatically passes headers required
-        for authentication against the CR API. Also, a retry-mechanism
-        for 5xx error codes is implemented.
+        Wraps `requests.Session.request` and automatically passes headers
+        required for authentication against the CR API. Requests returning
+        a `5xx` or `429` status code are retried according to `_retry`.
         Args:
             method:
                 HTTP method ("GET", "POST", ...).
             url:
                 Full Control Room API endpoint.
             kwargs:
-                Arguments passed to `requests.request`.
-            retries:
-                How often the request should be retried in case of an
-                unsuccessful request. A request is defined as unsuccessful
-                if the status code is `5xx`.
-            retry_wait_time:
-                Wait time before retrying after a failed request in seconds.
+                Arguments passed to `requests.Session.request`.
         Returns:
-            The return value of `requests.request`.
+            The return value of `requests.Session.request`.
         Raises:
             RuntimeError:
-                If the executed request returns a`5xx` status code for each
-                retry specified with `retries`.
+                If the executed request still returns a `4xx` or `5xx`
+                status code after all retries.
         """
 
-        if kwargs.get("headers") is not None:
-            kwargs["headers"].update(config().auth_header)
-        else:
-            kwargs["headers"] = config().auth_header
-
-        for i in range(retries):
-            # pylint: disable=missing-timeout
-            res = requests.request(
-                method=method,
-                url=url,
-                **kwargs,
-                json=body,
+        headers = kwargs.pop("headers", None) or {}
+        headers = {**headers, **config().auth_header}
+
+        # pylint: disable=missing-timeout
+        res = self._session.request(
+            method=method,
+            url=url,
+            headers=headers,
+            **kwargs,
+            json=body,
+        )
+
+        if 500 <= res.status_code < 600:
+            raise RuntimeError(
+                f"{method} request unsuccessful, status code: "
+                f'"{res.status_code}". Error message: "{res.text}"'
             )
+        elif 400 <= res.status_code < 500:
+            self._raise_client_error(res)
 
-            if str(res.status_code).startswith("5"):
-                if i == retries - 1:
-                    raise RuntimeError(
-                        "POST request unsuccessful, status code: "
-                        f'"{res.status_code}". Error message: "{res.text}"'
-                    )
-                else:
-                    time.sleep(retry_wait_time)
-                    continue
-            elif str(res.status_code).startswith("4"):
-                self._raise_client_error(res)
-            else:
-                res.raise_for_status()
-                return res
+        res.raise_for_status()
+        return res
 
     def _is_paginated_response(self, response_json: dict) -> bool:
         """States if the given CR response implements pagination."""
 
         return "has_more" in response_json
 
-    def _collect_paginated_results(self, response_json: dict) -> list:
-        """Combine all paginated results of given CR response into one list."""
+    def _iter_paginated(self, response_json: dict) -> Iterator[Any]:
+        """Yield the results of the given CR response and all following pages.
+
+        Each following page is only requested once the results of the
+        previous page have been consumed.
+        """
 
-        collected_data = []
         while True:
-            if data := response_json.get("data"):
-                collected_data.extend(data)
+            yield from response_json.get("data") or []
 
             if not response_json.get("has_more"):
-                break
+                return
 
-            res = self._request(method="GET", url=response_json.get("next"))
-            response_json = json.loads(res.text)
-
-        return collected_data
+            response_json = self._request(
+                method="GET", url=response_json.get("next")
+            ).json()
 
     def _get_cr_endpoint_from_route(self, route: str) -> str:
-        return urljoin(config().endpoint, route.lstrip("/"))
+        return _endpoint_prefix(config().endpoint) + route.lstrip("/")
 
     def _raise_client_error(self, response: requests.Response) -> None:
-        body = json.loads(response.text)
+        body = response.json()
 
         cr_err_code = body.get("error").get("code")
         cr_err_sub_code = body.get("error").get("subCode")
@@ -192,6 +224,12 @@ class _ControlRoomAPI:
         )
 
 
-@functools.lru_cache
+@functools.cache
 def api() -> _ControlRoomAPI:
     return _ControlRoomAPI()
+
+
+@functools.cache
+def _endpoint_prefix(endpoint: str) -> str:
+    """Return the given endpoint, ending with exactly one `/`."""
+    return endpoint.rstrip("/") + "/"
@@ -32,6 +32,6 @@ class _ControlRoomAPIConfig:
         return {"Authorization": f"RC-WSKEY {self.api_key}"}
 
 
-@functools.lru_cache
+@functools.cache
 def config() -> _ControlRoomAPIConfig:
     return _ControlRoomAPIConfig()
@@ -37,14 +37,13 @@ def list_work_items(
     work_items = api().get(
         route=f"/workspaces/{workspace_id}/work-items",
         params=params,
+        lazy=True,
     )
 
     if step_id:
-        work_items = [
-            w for w in work_items if w.get("step").get("id") == step_id
-        ]
+        return [w for w in work_items if w.get("step").get("id") == step_id]
 
-    return work_items
+    return list(work_items)
 
 
 def get_work_item(
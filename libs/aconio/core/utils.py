@@ -116,10 +116,21 @@ def replace_template_values(template_file: str, replace_values: dict[str, str]):
 
 
 def wait_until_succeeds(
-    retries: int, timeout: int, function: Callable[..., Any], *args, **kwargs
+    retries: int,
+    timeout: float,
+    function: Callable[..., Any],
+    *args,
+    backoff: float = 1,
+    max_timeout: float | None = None,
+    **kwargs,
 ) -> Any:
     """Call a function until it succeeds or `retries` is reached.
 
+    The names of the parameters of this function are reserved: `retries`,
+    `timeout`, `function`, `backoff` and `max_timeout` are consumed here and
+    never forwarded to `function`. Wrap a callable that expects any of these
+    names, e.g. with `functools.partial`.
+
     Args:
         retries:
             Maximum number of retries.
@@ -133,6 +144,14 @@ def wait_until_succeeds(
         *args:
             Positional arguments to pass to `function`.
 
+        backoff:
+            Factor the wait time is multiplied with after each failed
+            attempt. Defaults to 1, i.e. a constant wait time of `timeout`.
+
+        max_timeout:
+            Upper limit of the wait time between two attempts, if `backoff`
+            is used.
+
         **kwargs:
             Keyword arguments to pass to `function`.
 
@@ -147,6 +166,9 @@ def wait_until_succeeds(
         except Exception as exc:  # pylint: disable=broad-except
             if i < retries - 1:  # i is zero indexed
                 time.sleep(timeout)
+                timeout *= backoff
+                if max_timeout is not None:
+                    timeout = min(timeout, max_timeout)
             else:
                 raise exc
     return res
@@ -8,6 +8,12 @@ import aconio.db as db
 import aconio.core.utils as utils
 import aconio.dao.queries as queries
 
+_TAX_NUMBER_BRACKETS = re.compile(r"\(.*\)")
+_TAX_NUMBER_SEPARATORS = str.maketrans("", "", "/ ")
+
+_LANGUAGE_ISO: dict[str, str] = {"4": "en"}
+"""ISO codes of BMD `ADR_SPRACHNR` values. Any other language is German."""
+
 
 class BMDSachbearbeiter(enum.StrEnum):
     HAUPT = "HAUPT"
@@ -31,7 +37,7 @@ class EmployeeSelectionMode(enum.StrEnum):
 class Employee(pydantic.BaseModel):
     """Represent the employee responsible for the client."""
 
-    model_config = pydantic.ConfigDict(coerce_numbers_to_str=True)
+    model_config = pydantic.ConfigDict(coerce_numbers_to_str=True, frozen=True)
 
     bmd_id: str
     """
@@ -51,7 +57,15 @@ class Employee(pydantic.BaseModel):
 
 
 def filter_duplicate_employees(employees: list[Employee]) -> list[Employee]:
-    return list({e.bmd_id: e for e in employees}.values())
+    """Return employees with unique `bmd_id`, preserving their order."""
+    seen = set()
+    unique = []
+    for e in employees:
+        if e.bmd_id not in seen:
+            seen.add(e.bmd_id)
+            unique.append(e)
+
+    return unique
 
 
 class ContactPersonType(enum.StrEnum):
@@ -71,7 +85,7 @@ class ContactPersonType(enum.StrEnum):
 class ContactPerson(pydantic.BaseModel):
     """Represent a contact person of a client."""
 
-    model_config = pydantic.ConfigDict(coerce_numbers_to_str=True)
+    model_config = pydantic.ConfigDict(coerce_numbers_to_str=True, frozen=True)
 
     client_id: str
     last_name: str
@@ -92,16 +106,13 @@ class ContactPerson(pydantic.BaseModel):
                 # If last name is None, titles are also ignored, otherwise
                 # construct the full name with title prefix and suffix.
                 if last_name := self.last_name:
-                    name_positions = []
-                    if title_prefix := self.title_prefix:
-                        name_positions.append(title_prefix.strip())
-
-                    name_positions.append(last_name)
-
-                    if title_suffix := self.title_suffix:
-                        name_positions.append(title_suffix.strip())
+                    name_positions = (
+                        self.title_prefix and self.title_prefix.strip(),
+                        last_name,
+                        self.title_suffix and self.title_suffix.strip(),
+                    )
 
-                    return " ".join(name_positions)
+                    return " ".join(p for p in name_positions if p)
 
     def salutation_prefix(
         self, contact_person_type: ContactPersonType
@@ -121,13 +132,11 @@ class ContactPerson(pydantic.BaseModel):
         If either `salutation_prefix()` or `name()` is None, the combined
         salutation is also None.
         """
-        full_salutation = [
-            self.salutation_prefix(contact_person_type),
-            self.name(contact_person_type),
-        ]
+        prefix = self.salutation_prefix(contact_person_type)
+        name = self.name(contact_person_type)
 
-        if None not in full_salutation:
-            return " ".join([i.strip() for i in full_salutation]).rstrip(",")
+        if prefix is not None and name is not None:
+            return f"{prefix.strip()} {name.strip()}".rstrip(",")
 
 
 class Client(pydantic.BaseModel):
@@ -192,11 +201,7 @@ class Client(pydantic.BaseModel):
 
     @property
     def language_iso(self) -> str:
-        match str(self.language):
-            case "4":
-                return "en"
-            case _:
-                return "de"
+        return _LANGUAGE_ISO.get(self.language, "de")
 
     @property
     def last_name(self) -> str:
@@ -222,11 +227,11 @@ class Client(pydantic.BaseModel):
         - Removes `-` and the validation number that follows (e.g. `-42`).
         - Removes numbers in brackets and the brackets itself (e.g. `(42)`).
         """
-        client_tax_id = (
-            self.tax_number.replace("/", "").replace(" ", "").partition("-")[0]
-        )
+        client_tax_id = self.tax_number.translate(
+            _TAX_NUMBER_SEPARATORS
+        ).partition("-")[0]
 
-        return re.sub(r"\(.*\)", "", client_tax_id)
+        return _TAX_NUMBER_BRACKETS.sub("", client_tax_id)
 
     @property
     def employee_emails(self) -> list[str]:
@@ -250,6 +255,28 @@ class ClientDAO:
             client_bmd_company_id=client_bmd_company_id,
         )
 
+    def load_many(self, client_ids: list[tuple[str, str]]) -> list[Client]:
+        """Return multiple clients given their respective BMD ids.
+
+        The clients are retrieved in bulk, with one query per chunk of at
+        most 1000 ids. The result is equivalent to calling `with_ids`,
+        `set_emails_to_display` and `set_employees` (using
+        `BMDSachbearbeiter.HAUPT` and `EmployeeSelectionMode.SB_ONLY`) for
+        each client. The clients are returned in the order of `client_ids`.
+
+        Args:
+            client_ids:
+                List of `(client_bmd_id, client_bmd_company_id)` tuples.
+        """
+        clients = []
+        for client, sb in queries.clients_with_ids(
+            conn=self._conn, client_ids=client_ids
+        ):
+            client.employees = [sb] if sb else []
+            clients.append(client)
+
+        return clients
+
     def from_frist(self, bmd_frist_id: str) -> Client:
         """Return client associated with "Frist"."""
         return queries.client_from_frist(
@@ -323,10 +350,11 @@ class ClientDAO:
 
         emails, salutations = [], []
         for cp in cps:
-            emails.append(cp.email)
+            if cp.email:
+                emails.append(cp.email)
             salutations.append(cp.salutation(contact_person_type))
 
-        client.emails = emails
+        client.emails = list(dict.fromkeys(emails))
 
         # If one of the contact persons has no salutation defined, set the
         # full client salutation to None, since this should result in an error.
@@ -345,7 +373,10 @@ class ClientDAO:
     ):
         """Set the employees of the client."""
         responsibles = []
-        if bmd_responsible_areas:
+        if (
+            bmd_responsible_areas
+            and append_mode != EmployeeSelectionMode.SB_ONLY
+        ):
             responsibles = queries.responsible_employees(
                 bmddb=self._conn,
                 client_bmd_id=client.bmd_id,
@@ -3,15 +3,48 @@
 from __future__ import annotations
 
 import os
+import operator
+import functools
 
 import aconio.db as db
 import aconio.dao.client as client
 
 
+_MAX_CLIENT_IDS_PER_QUERY = 1000
+"""
+Maximum number of client ids passed to `clients_with_ids.sql` at once. Bounds
+the number of rows of the `VALUES` list, and thereby the size of a single
+statement.
+"""
+
+
+@functools.cache
 def full_path(file: str) -> str:
     return os.path.join(os.path.dirname(__file__), file)
 
 
+@functools.cache
+def _employee_columns(prefix: str) -> operator.itemgetter:
+    """Return a getter for the employee columns of a row with `prefix`."""
+    return operator.itemgetter(
+        *[
+            prefix + c
+            for c in ("bmd_id", "bmd_number", "bmd_company_id", "email")
+        ]
+    )
+
+
+def _employee_from_row(row: dict, prefix: str = "") -> client.Employee:
+    """Construct and validate an employee from a database row."""
+    bmd_id, bmd_number, bmd_company_id, email = _employee_columns(prefix)(row)
+    return client.Employee(
+        bmd_id=bmd_id,
+        bmd_number=bmd_number,
+        bmd_company_id=bmd_company_id,
+        email=email,
+    )
+
+
 def client_with_ids(
     conn: db.BaseConnection,
     client_bmd_id: str,
@@ -28,6 +61,47 @@ def client_with_ids(
         return client.Client(**rows[0])
 
 
+def clients_with_ids(
+    conn: db.BaseConnection,
+    client_ids: list[tuple[str, str]],
+) -> list[tuple[client.Client, client.Employee | None]]:
+    """Retrieve multiple clients and their "Sachbearbeiter" in one query.
+
+    The `emails` of each returned client are set to its `PER_DISPLAY_EMAIL`.
+    Large lists of ids are split into chunks of `_MAX_CLIENT_IDS_PER_QUERY`,
+    resulting in one query per chunk. The results are returned in the order
+    of `client_ids`. Ids without a matching client are skipped.
+    """
+    sql_filepath = full_path("queries/client/clients_with_ids.sql")
+
+    rows_by_id = {}
+    for start in range(0, len(client_ids), _MAX_CLIENT_IDS_PER_QUERY):
+        chunk = client_ids[start : start + _MAX_CLIENT_IDS_PER_QUERY]
+        rows = conn.iter_query_from_file(
+            sql_filepath=sql_filepath,
+            client_ids=",".join(["(%s, %s)"] * len(chunk)),
+            params=tuple(i for ids in chunk for i in ids),
+        )
+        for r in rows:
+            rows_by_id[(str(r["bmd_id"]), str(r["bmd_company_id"]))] = r
+
+    results = []
+    for bmd_id, bmd_company_id in client_ids:
+        if (r := rows_by_id.get((str(bmd_id), str(bmd_company_id)))) is None:
+            continue
+
+        c = client.Client(**r)
+        c.emails = [e] if (e := r.get("display_email")) else []
+
+        sb = None
+        if r.get("sb_bmd_id"):
+            sb = _employee_from_row(r, prefix="sb_")
+
+        results.append((c, sb))
+
+    return results
+
+
 def client_from_frist(
     conn: db.BaseConnection, bmd_frist_id: str
 ) -> client.Client | None:
@@ -62,16 +136,13 @@ def display_email(
     conn: db.BaseConnection, client_bmd_id: str, client_bmd_company_id: str
 ) -> list[str]:
     sql_filepath = full_path("queries/client/display_email.sql")
-    rows = conn.execute_query_from_file(
+    rows = conn.iter_query_from_file(
         sql_filepath=sql_filepath,
         client_bmd_id=client_bmd_id,
         client_bmd_company_id=client_bmd_company_id,
     )
 
-    if rows:
-        return [r.get("display_email") for r in rows if r.get("display_email")]
-
-    return []
+    return [e for r in rows if (e := r.get("display_email"))]
 
 
 def cp_by_identifier(
@@ -81,33 +152,27 @@ def cp_by_identifier(
     contact_person_identifier: str | None,
 ) -> list[client.ContactPerson]:
     sql_filepath = full_path("queries/client/cp_by_identifier.sql")
-    rows = conn.execute_query_from_file(
+    rows = conn.iter_query_from_file(
         sql_filepath=sql_filepath,
         client_bmd_id=client_bmd_id,
         client_bmd_company_id=client_bmd_company_id,
         identifier=contact_person_identifier,
     )
 
-    if rows:
-        return [client.ContactPerson(**r) for r in rows]
-
-    return []
+    return [client.ContactPerson(**r) for r in rows]
 
 
 def cp_main(
     conn: db.BaseConnection, client_bmd_id: str, client_bmd_company_id: str
 ) -> list[client.ContactPerson]:
     sql_filepath = full_path("queries/client/cp_main.sql")
-    rows = conn.execute_query_from_file(
+    rows = conn.iter_query_from_file(
         sql_filepath=sql_filepath,
         client_bmd_id=client_bmd_id,
         client_bmd_company_id=client_bmd_company_id,
     )
 
-    if rows:
-        return [client.ContactPerson(**r) for r in rows]
-
-    return []
+    return [client.ContactPerson(**r) for r in rows]
 
 
 def email_by_adressart(
@@ -119,17 +184,14 @@ def email_by_adressart(
     """Retrieve the email of the given `client.bmd_id` with an addresstype."""
 
     sql_filepath = full_path("queries/client/client_email_by_adressart.sql")
-    rows = bmddb.execute_query_from_file(
+    rows = bmddb.iter_query_from_file(
         sql_filepath=sql_filepath,
         client_bmd_id=client_bmd_id,
         client_bmd_company_id=client_bmd_company_id,
         email_address_type=email_address_type,
     )
 
-    if rows:
-        return [r["email"] for r in rows]
-
-    return []
+    return list(dict.fromkeys(e for r in rows if (e := r.get("email"))))
 
 
 def responsible_employees(
@@ -140,19 +202,15 @@ def responsible_employees(
 ) -> list[client.Employee]:
     """Retrieve the client's responsible employee."""
     sql_filepath = full_path("queries/employee/responsible_employees.sql")
-    rows = bmddb.execute_query_from_file(
+    rows = bmddb.iter_query_from_file(
         sql_filepath=sql_filepath,
         client_bmd_id=client_bmd_id,
         client_bmd_company_id=client_bmd_company_id,
-        responsible_areas=",".join(
-            ["'" + i + "'" for i in bmd_responsible_areas]
-        ),
+        responsible_areas=",".join(["%s"] * len(bmd_responsible_areas)),
+        params=tuple(bmd_responsible_areas),
     )
 
-    if rows:
-        return [client.Employee(**r) for r in rows]
-
-    return []
+    return [_employee_from_row(r) for r in rows]
 
 
 def sachbearbeiter_of_client(
@@ -0,0 +1,30 @@
+--- Obtain clients with their display e-mail and 'Sachbearbeiter' in one go ---
+SELECT
+    per.PER_PERSONENID                              AS "bmd_id",
+    per.PER_PERSONENNR                              AS "bmd_number",
+    per.PER_FIRMENNR                                AS "bmd_company_id",
+    kli.KLI_QUOTEN_FIRMENNR                         AS "bmd_tax_company_id",
+    per.PER_VORNAME                                 AS "first_name",
+    per.PER_NAME                                    AS "name",
+    adr.ADR_SPRACHNR                                AS "language",
+    per.PER_FSTEUERNR                               AS "tax_number",
+    bai.BAI_IBAN                                    AS "iban",
+    bai.BAI_SWIFTCODE                               AS "bic",
+    per.PER_DISPLAY_EMAIL                           AS "display_email",
+    per.PER_ZUSATZNAME                              AS "additional_name",
+    per_emp.PER_PERSONENID                          AS "sb_bmd_id",
+    per_emp.PER_PERSONENNR                          AS "sb_bmd_number",
+    per_emp.PER_FIRMENNR                            AS "sb_bmd_company_id",
+    per_emp.PER_DISPLAY_EMAIL                       AS "sb_email"
+FROM
+    BUERO.PER_PERSON per
+    JOIN (VALUES {client_ids}) ids (bmd_id, bmd_company_id)
+                                                    ON per.PER_PERSONENID = ids.bmd_id
+                                                    AND per.PER_FIRMENNR = ids.bmd_company_id
+    LEFT JOIN BUERO.KLI_KUNDE_LIEFERANT kli         ON per.PER_PERSONENID = kli.KLI_KLID
+                                                    AND per.PER_FIRMENNR = kli.KLI_FIRMENNR
+    LEFT JOIN BUERO.BAI_BANKINSTITUTIONSZU bai      ON per.PER_SENDER_BANKINSTLFDNR = bai.BAI_BANKINSTLFDNR
+    LEFT JOIN BUERO.ADR_ADRESSE adr                 ON per.PER_ADRESSLFDNR = adr.ADR_ADRESSLFDNR
+    LEFT JOIN BUERO.PER_PERSON per_emp              ON per.PER_SACHB_MITARBEITERID = per_emp.PER_PERSONENID
+                                                    AND per.PER_SACHB_FIRMENNR = per_emp.PER_FIRMENNR
+;
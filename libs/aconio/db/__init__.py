@@ -1,11 +1,23 @@
 """MSSQL database connection manager."""
 
+import functools
+
+from typing import Iterator
+
 import pymssql
 import robocorp.vault
 
 from abc import abstractmethod
 
 
+@functools.cache
+def _read_sql_file(sql_filepath: str) -> str:
+    """Return the contents of the given sql file, reading it only once."""
+    # pylint: disable=unspecified-encoding
+    with open(sql_filepath, "r") as file:
+        return file.read()
+
+
 class Config:
     """Configuration for a database connection."""
 
@@ -31,7 +43,19 @@ class BaseConnection:
     """Base database connection manager."""
 
     @abstractmethod
-    def execute_query_from_file(self, sql_filepath: str, **kwargs) -> dict:
+    def execute_query_from_file(
+        self, sql_filepath: str, params: tuple | None = None, **kwargs
+    ) -> dict:
+        raise NotImplementedError
+
+    @abstractmethod
+    def iter_query_from_file(
+        self,
+        sql_filepath: str,
+        batch_size: int = 1000,
+        params: tuple | None = None,
+        **kwargs,
+    ) -> Iterator[dict]:
         raise NotImplementedError
 
 
@@ -121,13 +145,23 @@ class MSSQLConnection:
     def is_connected(self) -> bool:
         return self._conn is not None
 
-    def execute_query_from_file(self, sql_filepath: str, **kwargs) -> dict:
+    def execute_query_from_file(
+        self, sql_filepath: str, params: tuple | None = None, **kwargs
+    ) -> dict:
         """Read, parse, and execute sql statement from file.
 
+        The file is only read from disk on its first use. Subsequent calls
+        reuse its cached contents.
+
         Args:
             sql_filepath:
                 Path to the file containing the sql statement.
 
+            params:
+                Query parameters bound to the `%s` placeholders of the sql
+                statement by the database driver. Use these for any values
+                that must not be interpolated into the statement itself.
+
             **kwargs:
                 Named Arguments passed to the `.format()` method of the
                 sql statement string.
@@ -138,14 +172,58 @@ class MSSQLConnection:
         Raises:
             RuntimeError: If the query execution fails.
         """
-        # pylint: disable=unspecified-encoding
-        with open(sql_filepath, "r") as file:
-            sql_stmt = file.read().format(**kwargs)
+        sql_stmt = _read_sql_file(sql_filepath).format(**kwargs)
+        try:
+            return self._execute_sql_stmt(sql_stmt, params)
+        except Exception as exc:
+            raise RuntimeError(f"Failed to execute query: {exc}") from exc
+
+    def iter_query_from_file(
+        self,
+        sql_filepath: str,
+        batch_size: int = 1000,
+        params: tuple | None = None,
+        **kwargs,
+    ) -> Iterator[dict]:
+        """Read, parse, and execute sql statement from file, yielding rows.
+
+        In contrast to `execute_query_from_file`, the result is not loaded
+        into memory at once, but fetched in batches of `batch_size` rows.
+        Note that the connection cannot be used for other queries until the
+        returned iterator is exhausted.
+
+        Args:
+            sql_filepath:
+                Path to the file containing the sql statement.
+
+            batch_size:
+                Number of rows fetched from the database at once.
+
+            params:
+                Query parameters bound to the `%s` placeholders of the sql
+                statement by the database driver.
+
+            **kwargs:
+                Named Arguments passed to the `.format()` method of the
+                sql statement string.
+
+        Yields:
+            Dictionary for each row of the result of the query.
+
+        Raises:
+            RuntimeError: If the query execution fails.
+        """
+        sql_stmt = _read_sql_file(sql_filepath).format(**kwargs)
+
+        with self._conn.cursor(as_dict=True) as cursor:
             try:
-                return self._execute_sql_stmt(sql_stmt)
+                cursor.execute(sql_stmt, params)
             except Exception as exc:
                 raise RuntimeError(f"Failed to execute query: {exc}") from exc
 
+            while rows := cursor.fetchmany(batch_size):
+                yield from rows
+
     def _open_connection(self):
         """Open connection to MSSQL Database."""
         self._conn = pymssql.connect(
@@ -155,9 +233,11 @@ class MSSQLConnection:
             self._cfg.database,
         )
 
-    def _execute_sql_stmt(self, sql_stmt: str) -> dict:
+    def _execute_sql_stmt(
+        self, sql_stmt: str, params: tuple | None = None
+    ) -> dict:
         """Open cursor, execute the sql statement, and return result."""
         with self._conn.cursor(as_dict=True) as cursor:
-            cursor.execute(sql_stmt)
+            cursor.execute(sql_stmt, params)
 
             return cursor.fetchall()
@@ -17,6 +17,6 @@ class DelayManager:
         return wait_time * self._factor
 
 
-@functools.lru_cache
+@functools.cache
 def delay() -> DelayManager:
     return DelayManager()
@@ -4,7 +4,6 @@ import os
 import contextlib
 
 import aconio.control_room as cr
-import aconio.outlook as outlook
 
 
 # pylint: disable=invalid-name
@@ -76,6 +75,11 @@ def _send_notification_mail(
         notification_recipients:
             E-Mail address(es) to send the notification mail to.
     """
+    # Outlook is imported lazily, since its dependencies are expensive to
+    # import and only required once a notification has to be sent.
+    # pylint: disable-next=import-outside-toplevel
+    import aconio.outlook as outlook
+
     workspace_info = cr.get_workspace(workspace_id)
 
     org_name = workspace_info.get("organization").get("name")
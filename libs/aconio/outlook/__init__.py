@@ -111,7 +111,7 @@ COMError = RPA.application.COMError
 OutlookApp = RPA.Outlook.Application.Application
 
 
-@functools.lru_cache
+@functools.cache
 def app() -> OutlookApp:
     return OutlookApp()
 
@@ -124,6 +124,9 @@ def start(retries: int = 3, delay: float = 5, minimize: bool = False) -> None:
     often occuring when using `open_application` simultaneously on different
     user accounts on the same server.
 
+    If Outlook has already been started by the current process and is still
+    responsive, it is reused instead of being restarted.
+
     Args:
         retries:
             Determines how often errors are ignored when trying to find the
@@ -137,6 +140,15 @@ def start(retries: int = 3, delay: float = 5, minimize: bool = False) -> None:
             start. Defaults to False.
     """
 
+    # Keep the Outlook instance already opened by this process, as long as it
+    # still responds, instead of performing a full restart
+    if is_open() and _is_responsive():
+        if minimize:
+            _minimize_window()
+        return
+
+    _accounts_by_email.cache_clear()
+
     # Quit any Outlook instances that may be open from previous runs to
     # prevent interference with the next application start
     try:
@@ -161,17 +173,33 @@ def start(retries: int = 3, delay: float = 5, minimize: bool = False) -> None:
     time.sleep(2)
 
     # Try to execute the `open_application` function multiple times to avoid
-    # server errors
+    # server errors. Start with short wait times, since most errors resolve
+    # quickly, but keep waiting for at least as long as with a fixed delay.
     utils.wait_until_succeeds(
-        retries=3,
-        timeout=5,
+        retries=6,
+        timeout=0.5,
         function=app().open_application,
+        backoff=2,
+        max_timeout=5,
     )
 
     if minimize:
-        windows.find_window(
-            'subname:"Outlook" class:rctrl_renwnd32'
-        ).minimize_window()
+        _minimize_window()
+
+
+def _is_responsive() -> bool:
+    """Return `True` if the opened Outlook application answers COM calls."""
+    try:
+        _ = app().app.Session.Accounts.Count
+    except Exception:  # pylint: disable=broad-except
+        return False
+    return True
+
+
+def _minimize_window() -> None:
+    windows.find_window(
+        'subname:"Outlook" class:rctrl_renwnd32'
+    ).minimize_window()
 
 
 def send_email(
@@ -258,11 +286,12 @@ def send_email(
     else:
         mail.Body = body
 
+    mail_attachments = mail.Attachments if attachments else None
     for attachment in attachments:
         filepath = os.path.abspath(attachment)
 
         try:
-            mail.Attachments.Add(filepath)
+            mail_attachments.Add(filepath, types.AttachmentType.BY_VALUE)
         except COMError as exc:
             raise RuntimeError(
                 f"Failed to add attachment '{filepath}' to mail!"
@@ -279,16 +308,33 @@ def send_email(
 
 
 def get_account_by_email(account_email: str) -> Any:
-    accounts = app().app.Session.Accounts
-    for i in range(1, accounts.Count + 1):
-        acc = accounts.Item(i)
-        if acc.SmtpAddress == account_email:
+    # Re-read the accounts once on a miss, in case an account was added
+    # since they were last read
+    for _ in range(2):
+        if acc := _accounts_by_email().get(account_email):
             return acc
+        _accounts_by_email.cache_clear()
+
     raise errors.AccountNotFoundError(
         f"Could not find account with e-mail '{account_email}'!"
     )
 
 
+@functools.cache
+def _accounts_by_email() -> dict[str, Any]:
+    """Return all Outlook accounts, mapped by their SMTP address.
+
+    The accounts are only read once via COM. The cache is cleared whenever
+    Outlook is (re)started by `start`.
+    """
+    accounts = app().app.Session.Accounts
+    by_email = {}
+    for i in range(1, accounts.Count + 1):
+        acc = accounts.Item(i)
+        by_email.setdefault(acc.SmtpAddress, acc)
+    return by_email
+
+
 def _configure_sender_account(mail: Any, account: Any) -> None:
     """Configure the sender account for an Outlook `MailItem`."""
 
@@ -317,7 +363,7 @@ def save_email(
             If `mail` is not of type `MailItem`.
     """
 
-    if type(mail).__name__ != "_MailItem":
+    if not _is_mail_item(mail):
         raise ValueError("Parameter `mail` must be a valid Outlook `MailItem`.")
 
     if not output_file_path.endswith(".msg"):
@@ -326,6 +372,11 @@ def save_email(
     mail.SaveAs(os.path.abspath(output_file_path))
 
 
+def _is_mail_item(obj: Any) -> bool:
+    """Return `True` if the given COM object is an Outlook `MailItem`."""
+    return getattr(obj, "Class", None) == types.ObjectClass.MAIL
+
+
 def delete_email(mail: Any) -> None:
     """Delete an Outlook `MailItem`.
 
@@ -340,7 +391,7 @@ def delete_email(mail: Any) -> None:
             If `mail` is not of type `MailItem`.
     """
 
-    if type(mail).__name__ != "_MailItem":
+    if not _is_mail_item(mail):
         raise ValueError("Parameter `mail` must be a valid Outlook `MailItem`.")
 
     mail.Delete()
@@ -350,6 +401,7 @@ def filter_emails(
     folder: Any,
     email_filter: str,
     sort: tuple[str, bool] = None,
+    top: int | None = None,
 ) -> list[Any]:
     """Find specific e-mails in an Outlook folder.
 
@@ -366,6 +418,9 @@ def filter_emails(
             be sorted in descending order, otherwise ascending.
             For example: `("[SentOn]", True)` for retrieving the most recently
             sent `MailItem` first.
+        top:
+            If set, only the first `top` mail items (after sorting) are
+            retrieved from Outlook and returned as a zero-indexed list.
 
     Returns:
         list[Any]:
@@ -389,9 +444,24 @@ def filter_emails(
     if sort:
         mails.Sort(sort[0], sort[1])
 
+    if top is not None:
+        return _first_items(mails, top)
+
     return mails
 
 
+def _first_items(items: Any, n: int) -> list[Any]:
+    """Return the first `n` elements of an Outlook `Items` collection."""
+    first = []
+    item = items.GetFirst() if n > 0 else None
+    while item is not None:
+        first.append(item)
+        if len(first) == n:
+            break
+        item = items.GetNext()
+    return first
+
+
 def get_folder_by_type(
     folder_type: types.FolderType, account_name: str | None
 ) -> Any:
@@ -3,7 +3,7 @@
 import enum
 
 
-class FolderType(enum.Enum):
+class FolderType(enum.IntEnum):
     """Outlook folder types mapped to their respective IDs."""
 
     INBOX = 6
@@ -15,3 +15,15 @@ class FolderType(enum.Enum):
     CALENDAR = 9
     CONTACTS = 10
     TASKS = 13
+
+
+class ObjectClass(enum.IntEnum):
+    """Outlook object classes (`OlObjectClass`) mapped to their IDs."""
+
+    MAIL = 43
+
+
+class AttachmentType(enum.IntEnum):
+    """Outlook attachment types (`OlAttachmentType`) mapped to their IDs."""
+
+    BY_VALUE = 1
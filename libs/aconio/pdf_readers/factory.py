@@ -15,16 +15,22 @@ class PDFReaderType(enum.StrEnum):
     ACROBAT = enum.auto()
 
 
+_READERS = {
+    PDFReaderType.CHROME: ChromeReader,
+    PDFReaderType.EDGE: EdgeReader,
+    PDFReaderType.ACROBAT: AcrobatReader,
+}
+
+
 class PDFReaderFactory:
     @staticmethod
     def determine_reader(
         reader: PDFReaderType, delay_manager: delay.DelayManager
     ):
         """Determine pdf reader based on the config."""
-        match reader:
-            case PDFReaderType.CHROME:
-                return ChromeReader(delay_manager)
-            case PDFReaderType.EDGE:
-                return EdgeReader(delay_manager)
-            case PDFReaderType.ACROBAT:
-                return AcrobatReader(delay_manager)
+        try:
+            reader_cls = _READERS[reader]
+        except KeyError as exc:
+            raise ValueError(f"Unknown PDF reader type '{reader}'!") from exc
+
+        return reader_cls(delay_manager)
@@ -1,6 +1,9 @@
 """USP helper class."""
 
 import os
+import functools
+
+from typing import Any
 
 from robocorp import vault, browser
 
@@ -35,7 +38,7 @@ class USP:
         """
         self._page.goto(self._base_url)
 
-        creds = vault.get_secret(vault_secret)
+        creds = _get_secret(vault_secret)
         self._page.locator("[id=tid]").fill(creds["teilnehmer_id"])
         self._page.locator("[id=benid]").fill(creds["benutzer_id"])
         self._page.locator("[id=pin]").fill(creds["pin"])
@@ -43,3 +46,26 @@ class USP:
 
     def pause(self) -> None:
         self._page.pause()
+
+    def _save_download(self, download: Any, filepath: str) -> None:
+        """Store a finished Playwright download at `filepath`.
+
+        The downloaded file is moved from Playwright's temporary directory if
+        possible. Only if that fails (e.g. `filepath` is located on a
+        different drive), the file is copied using `save_as`.
+        """
+        try:
+            os.replace(download.path(), filepath)
+        except OSError:
+            download.save_as(filepath)
+
+
+@functools.cache
+def _get_secret(secret_name: str) -> vault.SecretContainer:
+    """Return the given Robocorp vault secret, requesting it only once."""
+    return vault.get_secret(secret_name)
+
+
+def clear_secret_cache() -> None:
+    """Remove all vault secrets cached by previous logins from memory."""
+    _get_secret.cache_clear()
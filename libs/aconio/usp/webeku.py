@@ -1,18 +1,46 @@
 """Interactions with the WEBEKU service."""
 
 import re
-import time
 import datetime
 import functools
 
 from dataclasses import dataclass
 from enum import StrEnum
 
-from bs4 import BeautifulSoup
 from robocorp import browser
 
 from ._usp import USP
 
+_EXPAND_ALL_RE = re.compile("Alle.*")
+"""Name of the link that expands all rows of a table."""
+
+_READ_ACCOUNT_ROWS_JS = """
+rows => rows.map(row => {
+    const cols = row.querySelectorAll("td");
+    return [
+        cols[0].textContent.trim(),
+        Array.from(
+            cols[5].querySelectorAll("input"),
+            input => input.getAttribute("value"),
+        ),
+    ];
+})
+"""
+"""
+Return the "Beitragskontonummer" and the action values of each account row.
+"""
+
+_FIRST_ACCOUNT_CHANGED_JS = """
+prevOgkId => {
+    const cell = document.querySelector("tbody tr td");
+    return cell !== null && cell.textContent.trim() !== prevOgkId;
+}
+"""
+"""
+Return `true` once the first "Beitragskontonummer" of the accounts table
+differs from the given one.
+"""
+
 
 class Action(StrEnum):
     """Represent the available WE-BE-KU actions for an account."""
@@ -80,6 +108,12 @@ class WEBEKU(USP):
         self.__webeku = new_page_info.value
         self.__webeku.wait_for_load_state()
 
+        self.__search_btn = self.__webeku.get_by_role(
+            "button", name="Suchen", exact=True
+        )
+        self.__date_from_input = self.__webeku.get_by_label("atum von")
+        self.__date_to_input = self.__webeku.get_by_label("atum bis")
+
         # Choose the "Bevollmächtigter" which then directs to the WE-BE-KU
         # main page.
         self.__webeku.get_by_role("link", name=role).click()
@@ -99,13 +133,19 @@ class WEBEKU(USP):
             'not(contains(@class, "aui-dt-p-disabled"))]'
         )
         while True:
-            accounts.extend(self.__read_accounts_table())
+            page_accounts = self.__read_accounts_table()
+            accounts.extend(page_accounts)
 
             if not next_btn.is_visible():
                 break  # stop if next button not visible (no more pages).
             else:
                 next_btn.click()
-                time.sleep(1)
+
+                # Wait until the next page replaced the table contents.
+                self.__webeku.wait_for_function(
+                    _FIRST_ACCOUNT_CHANGED_JS,
+                    arg=page_accounts[0].ogk_id if page_accounts else None,
+                )
 
         return accounts
 
@@ -120,7 +160,7 @@ class WEBEKU(USP):
         self.__webeku.get_by_label("Beitragskontonummer").fill(
             ogk_account_number
         )
-        self.__webeku.get_by_role("button", name="Suchen", exact=True).click()
+        self.__search_btn.click()
 
     def select_menu(self, name: str):
         """Select a menu from the WE-BE-KU nav bar on the left side.
@@ -149,23 +189,20 @@ class WEBEKU(USP):
             "cell", name="Buchungsdatum", exact=True
         ).locator("label").click()
 
-        self.__webeku.get_by_label("atum von").fill(
-            start_date.strftime("%d.%m.%Y")
-        )
-        self.__webeku.get_by_label("atum bis").fill(
-            end_date.strftime("%d.%m.%Y")
-        )
+        self.__date_from_input.fill(_format_date(start_date))
+        self.__date_to_input.fill(_format_date(end_date))
 
-        self.__webeku.get_by_role("button", name="Suchen", exact=True).click()
+        self.__search_btn.click()
 
-        # Stop if "Es wurden keine AGH Buchungen" text is displayed!
-        if self.__webeku.get_by_text(
-            "Es wurden keine AGH Buchungen"
-        ).is_visible():
-            raise NoAghTransactionsFound()
-        elif self.__webeku.get_by_text(
+        # Stop if "Es wurden keine AGH Buchungen" text is displayed! Both
+        # messages are checked at once, since usually neither one is shown.
+        no_agh_msg = self.__webeku.get_by_text("Es wurden keine AGH Buchungen")
+        no_transactions_msg = self.__webeku.get_by_text(
             "wurden keine Buchungen gefunden!"
-        ).is_visible():
+        )
+        if no_agh_msg.or_(no_transactions_msg).first.is_visible():
+            if no_agh_msg.is_visible():
+                raise NoAghTransactionsFound()
             raise NoTransactionsFound()
 
     def download_pdf(self, filepath: str):
@@ -204,7 +241,7 @@ class WEBEKU(USP):
 
         # Wait for the download process to complete and save the downloaded
         # file.
-        download_info.value.save_as(filepath)
+        self._save_download(download_info.value, filepath)
 
     def __expand_all_rows(self):
         """Expand all rows of a table after a query (e.g. in 'Buchungen').
@@ -220,9 +257,7 @@ class WEBEKU(USP):
         if not self.__webeku.get_by_role(
             "img", name="Alle Buchungen zuklappen"
         ).is_visible():
-            expand_btn = self.__webeku.get_by_role(
-                "link", name=re.compile("Alle.*")
-            )
+            expand_btn = self.__webeku.get_by_role("link", name=_EXPAND_ALL_RE)
 
             if expand_btn.is_visible():
                 expand_btn.click()
@@ -233,27 +268,28 @@ class WEBEKU(USP):
                 )
 
     def __read_accounts_table(self) -> list[Account]:
-        """Parse all "Beitragskonten" from the "Kontoübersicht" table."""
+        """Parse all "Beitragskonten" from the "Kontoübersicht" table.
 
-        soup = BeautifulSoup(self.__webeku.content(), "html.parser")
+        The table is read within the browser in a single call, which avoids
+        transferring and parsing the HTML of the whole page.
+        """
 
-        accounts: list[Account] = []
-        for row in soup.find("tbody").find_all(
-            "tr"
-        ):  # only one table on this page
-            cols = row.find_all("td")
-
-            accounts.append(
-                Account(
-                    ogk_id=cols[0].text.strip(),
-                    actions=[
-                        Action(act.get("value"))
-                        for act in cols[5].find_all("input")
-                    ],
-                )
-            )
+        # Only one table on this page
+        rows = (
+            self.__webeku.locator("tbody")
+            .first.locator("tr")
+            .evaluate_all(_READ_ACCOUNT_ROWS_JS)
+        )
 
-        return accounts
+        return [
+            Account(ogk_id=ogk_id, actions=[Action(a) for a in actions])
+            for ogk_id, actions in rows
+        ]
+
+
+def _format_date(date: datetime.date) -> str:
+    """Format the given date as `DD.MM.YYYY`."""
+    return f"{date.day:02d}.{date.month:02d}.{date.year:04d}"
 
 
 @functools.lru_cache
@@ -1,12 +1,13 @@
 """Interactions with the WiEReG service."""
 
-import time
 import functools
 
 from robocorp import log
 
 from ._usp import USP
 
+_EXTRACT_CREATE_BTN = "[id='j_id_4c:auszug']"
+
 
 class _WiEReG(USP):
     """WiEReG Management System class.
@@ -25,8 +26,7 @@ class _WiEReG(USP):
         """Navigate to specific page in WiEReG Management System."""
 
         self._goto_home()
-
-        time.sleep(1)  # Wait for page to catch-up.
+        self._page.wait_for_load_state()
 
         # First, collapse to get the same starting point each time.
         collapse_btn = self._page.locator("[id='collapseTree']")
@@ -38,8 +38,6 @@ class _WiEReG(USP):
         expand_btn.wait_for(state="visible")
         expand_btn.click()
 
-        time.sleep(1)  # Wait for navigation to uncollapse.
-
         # Then click (now visible) menu item.
         page_btn = self._page.get_by_text(page_name, exact=True)
         page_btn.wait_for(state="visible")
@@ -105,21 +103,24 @@ class _WiEReG(USP):
         ).fill(stammzahl)
         self._page.locator("[id='j_id_4b:j_id_4t:j_id_4u:j_id_57']").click()
 
-        time.sleep(1)  # Wait for new page.
+        # Wait for the page that allows creating the extract.
+        self._page.locator(_EXTRACT_CREATE_BTN).wait_for(state="visible")
 
     def extract_create(self):
         """Download "einfach" extract."""
-        self._page.locator("[id='j_id_4c:auszug']").click()
+        self._page.locator(_EXTRACT_CREATE_BTN).click()
 
-        time.sleep(5)  # Wait for document creation.
+        # Wait for document creation.
+        self._page.get_by_text("Speichern").wait_for(
+            state="visible", timeout=30000
+        )
 
     def extract_save(self, filepath: str):
         """Save the downloaded extract to a file."""
         with self._page.expect_download() as download_info:
             self._page.get_by_text("Speichern").click()
 
-        download = download_info.value
-        download.save_as(filepath)
+        self._save_download(download_info.value, filepath)
 
     def _goto_home(self):
         """Navigate to WiEReG home page."""
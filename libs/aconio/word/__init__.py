@@ -1,11 +1,16 @@
 """Wrapper library for Robocorp's `RPA.Word.Application`."""
 
 import functools
-
-from typing import Any
+import contextlib
 
 from RPA.Word.Application import Application as WordApp
 
+_WD_FIND_STOP = 0
+"""`WdFindWrap` value which stops the search at the end of the document."""
+
+_WD_COLLAPSE_END = 0
+"""`WdCollapseDirection` value which collapses a range to its end."""
+
 
 @functools.lru_cache
 def app() -> WordApp:
@@ -15,6 +20,10 @@ def app() -> WordApp:
 def replace_text_with_image(placeholder: str, image_path: str) -> None:
     """Replace `placeholder` with image from `image_path`.
 
+    Every occurrence of `placeholder` in the current document is replaced.
+    The occurrences are located with Word's own `Find`, so the text of the
+    document is not transferred through COM paragraph by paragraph.
+
     Args:
         placeholder:
             The string within the current Word document to be replaced by the
@@ -24,44 +33,35 @@ def replace_text_with_image(placeholder: str, image_path: str) -> None:
     """
 
     # pylint: disable=protected-access
-    for paragraph in app()._active_document.Paragraphs:
-        if placeholder in paragraph.Range.Text:
-            _replace_text_with_image_in_range(
-                paragraph.Range, placeholder, image_path
+    doc_range = app()._active_document.Content
+
+    with _screen_updating_disabled():
+        # A successful `Execute` redefines `doc_range` to the placeholder.
+        while doc_range.Find.Execute(
+            FindText=placeholder,
+            MatchCase=True,
+            MatchWildcards=False,
+            Forward=True,
+            Wrap=_WD_FIND_STOP,
+        ):
+            # Clear the placeholder text and insert the image
+            doc_range.Text = ""
+            doc_range.InlineShapes.AddPicture(
+                FileName=image_path, LinkToFile=False, SaveWithDocument=True
             )
 
-
-def _replace_text_with_image_in_range(
-    doc_range: Any, placeholder: str, image_path: str
-) -> None:
-    """Replace `placeholder` with image from `image_path` in given `doc_range`.
-
-    Args:
-        placeholder:
-            The string within the current Word document to be replaced by the
-            given image.
-        image_path:
-            Full path to the image file.
-        doc_range:
-            The range within the current Word document where the replacement
-            should take place.
-
-    Raises:
-        ValueError: If the `placeholder` is not found in the given `doc_range`.
-    """
-
-    pos = doc_range.Text.find(placeholder)
-
-    if pos == -1:
-        raise ValueError(f"Placeholder '{placeholder}' not found in range.")
-
-    # Create a new range specifically for the placeholder
-    placeholder_range = doc_range.Duplicate
-    placeholder_range.Start = placeholder_range.Start + pos
-    placeholder_range.End = placeholder_range.Start + len(placeholder)
-
-    # Clear the placeholder text and insert the image
-    placeholder_range.Text = ""
-    placeholder_range.InlineShapes.AddPicture(
-        FileName=image_path, LinkToFile=False, SaveWithDocument=True
-    )
+            # Continue searching after the inserted image
+            doc_range.Collapse(_WD_COLLAPSE_END)
+
+
+@contextlib.contextmanager
+def _screen_updating_disabled():
+    """Suspend repainting of the Word window while the context is active."""
+    word = app().app
+    screen_updating = word.ScreenUpdating
+    word.ScreenUpdating = False
+    try:
+        yield
+    finally:
+        word.ScreenUpdating = screen_updating
+        word.ScreenRefresh()
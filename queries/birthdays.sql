@@ -1,4 +1,4 @@
--- Get E-Mail and date of birth for each client. --
+-- Get E-Mail and date of birth for each client having a birthday today. --
 SELECT
     per.PER_PERSONENID       AS "bmd_id",
     per.PER_FIRMENNR         AS "bmd_company_id",
@@ -8,11 +8,14 @@ FROM BUERO.PER_PERSON per
                                         AND per.PER_FIRMENNR = kli.KLI_FIRMENNR
 WHERE per.PER_FIRMENNR = 1
     AND per.PER_VORNAME IS NOT NULL
+    -- '%%' is an escaped '%', since the query is executed with parameters.
     AND per.PER_PERSONENID LIKE 'KL2000%%'
     AND kli.KLI_ISTAKTUELLKENNUNG = 1
     AND kli.KLI_ISTKUNDE = 1
     AND per.PER_GEBURTSDATUM IS NOT NULL
+    AND MONTH(per.PER_GEBURTSDATUM) = %s
+    AND DAY(per.PER_GEBURTSDATUM) = %s
     AND per.PER_DISPLAY_EMAIL IS NOT NULL
     AND per.PER_DISPLAY_EMAIL NOT LIKE 'KA'
 ORDER BY per.PER_NAME
-;
\ No newline at end of file
+;
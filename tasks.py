@@ -12,28 +12,27 @@ import bot._items as _items
 
 faulthandler.disable()
 
+_SETUPS = {
+    "producer": bot.producer.setup,
+    "consumer": bot.consumer.setup,
+}
+
+_TEARDOWNS = {
+    "producer": bot.producer.teardown,
+    "consumer": bot.consumer.teardown,
+}
+
 
 @tasks.setup(scope="task")
 def before_each(tsk):
-
-    match tsk.name:
-        case "producer":
-            bot.producer.setup()
-        case "consumer":
-            bot.consumer.setup()
-        case "reporter":
-            bot.reporter.setup()
+    if setup := _SETUPS.get(tsk.name):
+        setup()
 
 
 @tasks.teardown(scope="task")
 def after_each(tsk):
-    match tsk.name:
-        case "producer":
-            bot.producer.teardown()
-        case "consumer":
-            bot.consumer.teardown()
-        case "reporter":
-            bot.reporter.teardown()
+    if teardown := _TEARDOWNS.get(tsk.name):
+        teardown()
 
 
 @tasks.task
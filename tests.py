@@ -5,17 +5,20 @@ import jinja2 as j2
 import faulthandler
 import functools
 
+from unittest import mock
+
 from bot import _items
 
 from aconio import outlook, db
-from aconio.core import errors
+from aconio.core import errors, utils
 
 from robocorp import tasks
 
 
-@functools.lru_cache
+@functools.cache
 def jinja_env() -> j2.Environment:
-    return j2.Environment()
+    templates = os.path.join(os.environ.get("ROBOT_ROOT"), "templates")
+    return j2.Environment(loader=j2.FileSystemLoader(templates))
 
 
 @functools.lru_cache
@@ -51,11 +54,25 @@ def test_create_email() -> None:
     )
 
 
-def _render_template() -> str:
-    templates = os.path.join(os.environ.get("ROBOT_ROOT"), "templates")
+@tasks.task
+def test_wait_until_succeeds_backoff() -> None:
+    """Verify that the retry wait time grows and is capped at `max_timeout`."""
+
+    attempts = iter([ValueError, ValueError, ValueError, ValueError, "done"])
+
+    def flaky() -> str:
+        res = next(attempts)
+        if res is ValueError:
+            raise res()
+        return res
 
-    jinja_env().loader = j2.FileSystemLoader(templates)
+    with mock.patch.object(utils.time, "sleep") as sleep:
+        res = utils.wait_until_succeeds(5, 1, flaky, backoff=2, max_timeout=3)
 
-    template = jinja_env().get_template("mail.j2")
+    waits = [c.args[0] for c in sleep.call_args_list]
+    assert res == "done", res
+    assert waits == [1, 2, 3, 3], waits
 
-    return template.render()
+
+def _render_template() -> str:
+    return jinja_env().get_template("mail.j2").render()